@@ -8,24 +8,39 @@ from xeofs.models.mca import MCA
 from ..utilities import data_is_dask
 
 
+@pytest.fixture(
+    scope="module",
+    params=[
+        (("time",)),
+        (("lat", "lon")),
+        (("lon", "lat")),
+    ],
+)
+def dim(request):
+    return request.param
+
+
 @pytest.fixture
 def mca_model():
     return MCA()
 
 
+@pytest.fixture(scope="module")
+def fitted_mca_model(mock_data_array, dim):
+    """MCA model fitted once per `dim` on `mock_data_array`.
+
+    Shared by the tests that only read from the fitted model.
+    """
+    model = MCA()
+    model.fit(mock_data_array, mock_data_array, dim)
+    return model
+
+
 def test_initialization():
     mca = MCA()
     assert mca is not None
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit(mca_model, mock_data_array, dim):
     mca_model.fit(mock_data_array, mock_data_array, dim)
     assert hasattr(mca_model, "preprocessor1")
@@ -33,27 +48,11 @@ def test_fit(mca_model, mock_data_array, dim):
     assert hasattr(mca_model, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit_empty_data(mca_model, dim):
     with pytest.raises(ValueError):
         mca_model.fit(xr.DataArray(), xr.DataArray(), dim)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit_invalid_dims(mca_model, mock_data_array, dim):
     with pytest.raises(ValueError):
         mca_model.fit(
@@ -61,14 +60,6 @@ def test_fit_invalid_dims(mca_model, mock_data_array, dim):
         )
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit_with_dataset(mca_model, mock_dataset, dim):
     mca_model.fit(mock_dataset, mock_dataset, dim)
     assert hasattr(mca_model, "preprocessor1")
@@ -76,14 +67,6 @@ def test_fit_with_dataset(mca_model, mock_dataset, dim):
     assert hasattr(mca_model, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_fit_with_dataarray_list(mca_model, mock_data_array_list, dim):
     mca_model.fit(mock_data_array_list, mock_data_array_list, dim)
     assert hasattr(mca_model, "preprocessor1")
@@ -91,110 +74,47 @@ def test_fit_with_dataarray_list(mca_model, mock_data_array_list, dim):
     assert hasattr(mca_model, "data")
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_transform(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    result = mca_model.transform(data1=mock_data_array, data2=mock_data_array)
+def test_transform(fitted_mca_model, mock_data_array, dim):
+    result = fitted_mca_model.transform(data1=mock_data_array, data2=mock_data_array)
     assert isinstance(result, list)
     assert isinstance(result[0], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_inverse_transform(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
+def test_inverse_transform(fitted_mca_model):
     # Assuming mode as 1 for simplicity
-    scores1 = mca_model.data["scores1"].isel(mode=1)
-    scores2 = mca_model.data["scores2"].isel(mode=1)
-    Xrec1, Xrec2 = mca_model.inverse_transform(scores1, scores2)
+    scores1 = fitted_mca_model.data["scores1"].isel(mode=1)
+    scores2 = fitted_mca_model.data["scores2"].isel(mode=1)
+    Xrec1, Xrec2 = fitted_mca_model.inverse_transform(scores1, scores2)
     assert isinstance(Xrec1, xr.DataArray)
     assert isinstance(Xrec2, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    squared_covariance = mca_model.squared_covariance()
+def test_squared_covariance(fitted_mca_model):
+    squared_covariance = fitted_mca_model.squared_covariance()
     assert isinstance(squared_covariance, xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_squared_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scf = mca_model.squared_covariance_fraction()
+def test_squared_covariance_fraction(fitted_mca_model):
+    scf = fitted_mca_model.squared_covariance_fraction()
     assert isinstance(scf, xr.DataArray)
     assert scf.sum("mode") <= 1.00001, "Squared covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_singular_values(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    n_modes = mca_model.get_params()["n_modes"]
-    svals = mca_model.singular_values()
+def test_singular_values(fitted_mca_model):
+    n_modes = fitted_mca_model.get_params()["n_modes"]
+    svals = fitted_mca_model.singular_values()
     assert isinstance(svals, xr.DataArray)
     assert svals.size == n_modes
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_covariance_fraction(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    cf = mca_model.covariance_fraction()
+def test_covariance_fraction(fitted_mca_model):
+    cf = fitted_mca_model.covariance_fraction()
     assert isinstance(cf, xr.DataArray)
     assert cf.sum("mode") <= 1.00001, "Covariance fraction is greater than 1"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_components(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    components1, components2 = mca_model.components()
+def test_components(fitted_mca_model, mock_data_array, dim):
+    components1, components2 = fitted_mca_model.components()
     feature_dims = tuple(set(mock_data_array.dims) - set(dim))
     assert isinstance(components1, xr.DataArray)
     assert isinstance(components2, xr.DataArray)
@@ -206,14 +126,6 @@ def test_components(mca_model, mock_data_array, dim):
     ), "Components2 does not have the right feature dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_components_dataset(mca_model, mock_dataset, dim):
     mca_model.fit(mock_dataset, mock_dataset, dim)
     components1, components2 = mca_model.components()
@@ -234,14 +146,6 @@ def test_components_dataset(mca_model, mock_dataset, dim):
     ), "Components does not have the right feature dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_components_dataarray_list(mca_model, mock_data_array_list, dim):
     mca_model.fit(mock_data_array_list, mock_data_array_list, dim)
     components1, components2 = mca_model.components()
@@ -262,17 +166,8 @@ def test_components_dataarray_list(mca_model, mock_data_array_list, dim):
         ), "Components2 does not have the right feature dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_scores(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    scores1, scores2 = mca_model.scores()
+def test_scores(fitted_mca_model, dim):
+    scores1, scores2 = fitted_mca_model.scores()
     assert isinstance(scores1, xr.DataArray)
     assert isinstance(scores2, xr.DataArray)
     assert set(scores1.dims) == set(
@@ -283,14 +178,6 @@ def test_scores(mca_model, mock_data_array, dim):
     ), "Scores2 does not have the right dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_scores_dataset(mca_model, mock_dataset, dim):
     mca_model.fit(mock_dataset, mock_dataset, dim)
     scores1, scores2 = mca_model.scores()
@@ -304,14 +191,6 @@ def test_scores_dataset(mca_model, mock_dataset, dim):
     ), "Scores2 does not have the right dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 def test_scores_dataarray_list(mca_model, mock_data_array_list, dim):
     mca_model.fit(mock_data_array_list, mock_data_array_list, dim)
     scores1, scores2 = mca_model.scores()
@@ -325,51 +204,23 @@ def test_scores_dataarray_list(mca_model, mock_data_array_list, dim):
     ), "Scores2 does not have the right dimensions"
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_homogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    patterns, pvals = mca_model.homogeneous_patterns()
+def test_homogeneous_patterns(fitted_mca_model):
+    patterns, pvals = fitted_mca_model.homogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
     assert isinstance(pvals[0], xr.DataArray)
     assert isinstance(pvals[1], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
-def test_heterogeneous_patterns(mca_model, mock_data_array, dim):
-    mca_model.fit(mock_data_array, mock_data_array, dim)
-    patterns, pvals = mca_model.heterogeneous_patterns()
+def test_heterogeneous_patterns(fitted_mca_model):
+    patterns, pvals = fitted_mca_model.heterogeneous_patterns()
     assert isinstance(patterns[0], xr.DataArray)
     assert isinstance(patterns[1], xr.DataArray)
     assert isinstance(pvals[0], xr.DataArray)
     assert isinstance(pvals[1], xr.DataArray)
 
 
-@pytest.mark.parametrize(
-    "dim, compute",
-    [
-        (("time",), True),
-        (("lat", "lon"), True),
-        (("lon", "lat"), True),
-        (("time",), False),
-        (("lat", "lon"), False),
-        (("lon", "lat"), False),
-    ],
-)
+@pytest.mark.parametrize("compute", [True, False])
 def test_compute(mock_dask_data_array, dim, compute):
     mca_model = MCA(n_modes=10, compute=compute)
     mca_model.fit(mock_dask_data_array, mock_dask_data_array, (dim))
@@ -385,14 +236,6 @@ def test_compute(mock_dask_data_array, dim, compute):
         assert data_is_dask(mca_model.data["components2"])
 
 
-@pytest.mark.parametrize(
-    "dim",
-    [
-        (("time",)),
-        (("lat", "lon")),
-        (("lon", "lat")),
-    ],
-)
 @pytest.mark.parametrize("engine", ["netcdf4", "zarr"])
 def test_save_load(dim, mock_data_array, tmp_path, engine):
     """Test save/load methods in MCA class, ensuring that we can